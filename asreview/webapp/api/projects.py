@@ -1613,6 +1613,57 @@ def api_classify_instance(project, doc_id):  # noqa: F401
     return response
 
 
+@bp.route("/projects/<project_id>/records", methods=["POST"])
+@asreview_login_required
+@project_authorization
+@project_from_id
+def api_classify_instances(project):  # noqa: F401
+    """Label multiple items
+
+    This request handles a JSON list of records with the keys doc_id, label
+    and optionally note and is_prior. The records should be either all prior
+    knowledge or all pending records. The labels are added to the state in a
+    single write. The model is retrained if the records are not prior
+    knowledge.
+    """
+    records = request.get_json(silent=True)
+    if not isinstance(records, list) or len(records) == 0:
+        raise ValueError("Expected a list of records to label.")
+
+    try:
+        record_ids = [int(record["doc_id"]) for record in records]
+        labels = [int(record["label"]) for record in records]
+        notes = [record.get("note") or None for record in records]
+        is_prior = {record.get("is_prior", 0) in [1, "1"] for record in records}
+    except (AttributeError, KeyError, TypeError, ValueError):
+        raise ValueError("Each record should have a doc_id and a label.")
+
+    if len(is_prior) > 1:
+        raise ValueError("Records should be either all prior knowledge or not.")
+    prior = is_prior.pop()
+
+    with open_state(project.project_path, read_only=False) as state:
+        state.add_labeling_data(
+            record_ids=record_ids, labels=labels, notes=notes, prior=prior
+        )
+
+    if not prior:
+        # retrain model
+        subprocess.Popen(
+            [
+                _get_executable(),
+                "-m",
+                "asreview",
+                "web_run_model",
+                str(project.project_path),
+            ]
+        )
+
+    response = jsonify({"success": True})
+
+    return response
+
+
 @bp.route("/projects/<project_id>/get_document", methods=["GET"])
 @asreview_login_required
 @project_authorization
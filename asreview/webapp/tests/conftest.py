@@ -14,12 +14,25 @@
 
 import os
 import shutil
+import sqlite3
+import time
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import urlretrieve
+from uuid import NAMESPACE_URL
+from uuid import uuid5
 
 import pytest
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
+from asreview.datasets import DatasetManager
+from asreview.project import open_state
 from asreview.utils import asreview_path
 from asreview.webapp import DB
+from asreview.webapp.authentication.models import Project
 from asreview.webapp.authentication.models import User
 from asreview.webapp.start_flask import create_app
 
@@ -28,6 +41,73 @@ try:
 except ImportError:
     TMP_ENV_VARS = {}
 
+# credentials of the user of setup_teardown_signed_in
+SIGNED_IN_EMAIL = "c.s.kaandorp@uu.nl"
+SIGNED_IN_PASSWORD = "123456!AbC"
+
+
+def pytest_configure(config):
+    # register the pytest-xdist marker, tests also run without the plugin
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests of the group on one worker"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep the tests of a module on a single pytest-xdist worker.
+
+    The tests in a module share a module scoped app, database and
+    asreview folder and depend on the order in which they run. Run the
+    suite with ``pytest -n auto --dist=loadgroup`` to distribute the
+    modules over the workers. Modules can opt in to a named group with
+    ``pytestmark = pytest.mark.xdist_group(...)``.
+    """
+    for item in items:
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def asreview_test_folder(request, tmp_path_factory):
+    """Store the projects and databases of a test module in a temporary
+    folder. Every module gets its own folder, so project folders left
+    behind by a module (for example by a model that is still training)
+    are not seen by the next module on the same pytest-xdist worker."""
+    folder = tmp_path_factory.mktemp(request.module.__name__.split(".")[-1])
+    TMP_ENV_VARS["ASREVIEW_PATH"] = str(folder)
+    os.environ.update(TMP_ENV_VARS)
+    return folder
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cached_benchmark_datasets(tmp_path_factory):
+    """Download every benchmark dataset at most once per test session.
+
+    The data endpoint looks up benchmark datasets in the online index and
+    downloads the file on each upload. The first lookup stores the file
+    in a temporary folder, later lookups return the local copy.
+    """
+    cache_folder = tmp_path_factory.mktemp("datasets")
+    find = DatasetManager.find
+
+    @lru_cache(maxsize=None)
+    def _cached_dataset(dataset_id):
+        dataset = find(DatasetManager(), dataset_id)
+        fp = cache_folder / Path(urlparse(dataset.filepath).path).name
+        urlretrieve(dataset.filepath, fp)
+        dataset.filepath = f"file://localhost{fp}"
+        return dataset
+
+    def cached_find(self, dataset_id):
+        if isinstance(dataset_id, str) and dataset_id.startswith("benchmark:"):
+            return _cached_dataset(dataset_id)
+        return find(self, dataset_id)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DatasetManager, "find", cached_find)
+        yield cache_folder
+
 
 def signup_user(client, identifier, password="!biuCrgfsiOOO6987"):
     """Signs up a user through the api"""
@@ -53,6 +133,93 @@ def signout(client):
     return client.delete("/auth/signout")
 
 
+def get_folder_content(path):
+    """Get the names of the files and folders in a folder"""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+def count_rows(model):
+    """Count the rows of a database model without loading them"""
+    return DB.session.scalar(select(func.count()).select_from(model))
+
+
+def get_user_with_projects(user_id):
+    """Get a user and eagerly load its projects"""
+    return DB.session.execute(
+        select(User).options(selectinload(User.projects)).where(User.id == user_id)
+    ).scalar_one()
+
+
+def wait_for_status(client, project_id, status, timeout=30.0, interval=0.1):
+    """Poll the status of a project until it has the expected value.
+
+    The model is trained in a subprocess, so the status endpoint is
+    the only way to find out if it is ready.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        response = client.get(f"/api/projects/{project_id}/status")
+        if response.status_code != 200:
+            pytest.fail(response.get_json()["message"])
+        if response.get_json()["status"] == status:
+            return response
+        if time.monotonic() > deadline:
+            pytest.fail(f"Project status is not '{status}' after {timeout} seconds")
+        time.sleep(interval)
+
+
+def _training_locked(lock_file):
+    """Check if a model run holds the training lock of a project"""
+    if not lock_file.exists():
+        return False
+    db = sqlite3.connect(str(lock_file))
+    try:
+        lock = db.execute("SELECT name FROM locks WHERE name = 'training'")
+        return lock.fetchone() is not None
+    except sqlite3.OperationalError:
+        # the lock table is being created
+        return True
+    finally:
+        db.close()
+
+
+def wait_for_training(project_path, timeout=60.0, interval=0.2):
+    """Wait until the model is trained on all labeled records.
+
+    Labeling a record retrains the model in a subprocess. The training
+    is done when the state has no new labels and the training lock of
+    the project is free.
+    """
+    lock_file = Path(project_path, "lock.sqlite")
+    deadline = time.monotonic() + timeout
+    while True:
+        with open_state(project_path) as state:
+            new_labels = state.exist_new_labeled_records
+        if not new_labels and not _training_locked(lock_file):
+            return
+        if time.monotonic() > deadline:
+            pytest.fail(f"Model is not trained after {timeout} seconds")
+        time.sleep(interval)
+
+
+@pytest.fixture(scope="session")
+def auth_app():
+    """Authenticated app with an in-memory database.
+
+    The app and its database are created once per test session (or
+    pytest-xdist worker). Flask-SQLAlchemy serves in-memory SQLite
+    databases from a single connection (StaticPool).
+    """
+    # setup environment variables
+    os.environ.update(TMP_ENV_VARS)
+    # load appropriate config file
+    root_dir = str(Path(os.path.abspath(__file__)).parent)
+    config_file_path = f"{root_dir}/configs/auth_config_in_memory_db.json"
+    # create app (and the database tables)
+    return create_app(enable_auth=True, flask_configfile=config_file_path)
+
+
 # TODO@{Casper}:
 # Something nasty happens when execute multiple test
 # modules, if one stops it takes a while before
@@ -60,18 +227,17 @@ def signout(client):
 # a problem for the still running file (emptying the
 # database, removing the asreview folder...)
 @pytest.fixture(scope="module")
-def setup_teardown_signed_in():
-    """Setup and teardown with a signed in user."""
-    # setup environment variables
-    os.environ.update(TMP_ENV_VARS)
-    # load appropriate config file
-    root_dir = str(Path(os.path.abspath(__file__)).parent)
-    config_file_path = f"{root_dir}/configs/auth_config.json"
-    # create app and client
-    app = create_app(enable_auth=True, flask_configfile=config_file_path)
+def setup_teardown_signed_in(auth_app):
+    """Setup and teardown with a signed in user.
+
+    The tests of a module build on each other, so the user and its
+    projects live for the entire module. The database tables and the
+    project folders are reset when the module is done.
+    """
+    app = auth_app
     with app.app_context():
         client = app.test_client()
-        email, password = "c.s.kaandorp@uu.nl", "123456!AbC"
+        email, password = SIGNED_IN_EMAIL, SIGNED_IN_PASSWORD
         # create user
         signup_user(client, email, password)
         # signin this user
@@ -79,13 +245,83 @@ def setup_teardown_signed_in():
         user = DB.session.query(User).filter(User.identifier == email).one_or_none()
         yield app, client, user
 
-        try:
-            # remove the entire .asreview-test folder
-            # which also removes the database
-            shutil.rmtree(asreview_path())
-        except Exception:
-            # don't care
-            pass
+        # empty the database for the next module
+        DB.session.remove()
+        DB.drop_all()
+        DB.create_all()
+
+        # remove the project folders
+        shutil.rmtree(asreview_path(), ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def signed_in_get(setup_teardown_signed_in):
+    """GET requests as the signed in user without a cookie jar.
+
+    The user signs in once more with a cookie-less client. The session
+    cookie of that response is sent along with every request. Only use
+    this for requests that don't change the session.
+    """
+    app, _, _ = setup_teardown_signed_in
+    stateless_client = app.test_client(use_cookies=False)
+
+    response = signin_user(stateless_client, SIGNED_IN_EMAIL, SIGNED_IN_PASSWORD)
+    cookie_name = app.config["SESSION_COOKIE_NAME"]
+    session_cookie = next(
+        cookie.split(";", 1)[0]
+        for cookie in response.headers.getlist("Set-Cookie")
+        if cookie.startswith(f"{cookie_name}=")
+    )
+    headers = {"Cookie": session_cookie}
+
+    def get(url):
+        return stateless_client.get(url, headers=headers)
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def project_uuid():
+    """Expected id (and folder name) of a project owned by a user
+    in the authenticated app.
+
+    The id is derived here from the project slug (the lowercase name
+    with non-alphanumeric characters replaced by "-"), independent of
+    the webapp, to detect changes in the way project ids are created.
+    """
+
+    @lru_cache(maxsize=None)
+    def _project_uuid(project_slug, user_id):
+        user_uuid = uuid5(NAMESPACE_URL, str(user_id)).hex
+        return uuid5(NAMESPACE_URL, project_slug + user_uuid).hex
+
+    return _project_uuid
+
+
+# project folders of leaked projects that have been reported already
+_LEAKED_PROJECTS = set()
+
+
+@pytest.fixture
+def no_project_leak(asreview_test_folder):
+    """Check after a test that every project in the database still has
+    a project folder.
+
+    A leaked project is reported once, by the test that leaves it
+    behind. Folders without a database entry are not checked, a model
+    that is still training in the background can write them.
+    """
+    yield
+    project_paths = {
+        asreview_test_folder / project_id
+        for project_id in DB.session.scalars(select(Project.project_id))
+    }
+    leaked = {path for path in project_paths if not path.is_dir()}
+    leaked -= _LEAKED_PROJECTS
+    _LEAKED_PROJECTS.update(leaked)
+    if leaked:
+        names = ", ".join(sorted(path.name for path in leaked))
+        pytest.fail(f"Projects without a project folder: {names}")
 
 
 @pytest.fixture(scope="module")
@@ -99,8 +335,8 @@ def setup_teardown_unauthorized():
     client = app.test_client()
 
     yield app, client
-    # remove the entire .asreview-test folder
-    shutil.rmtree(asreview_path())
+    # remove the project folders
+    shutil.rmtree(asreview_path(), ignore_errors=True)
 
 
 @pytest.fixture
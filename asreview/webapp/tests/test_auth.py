@@ -50,7 +50,7 @@ def setup_teardown_standard(request):
         config_file_path = f"{root_dir}/configs/auth_config_verification.json"
     else:
         # user creation WITHOUT email verification
-        config_file_path = f"{root_dir}/configs/auth_config.json"
+        config_file_path = f"{root_dir}/configs/auth_config_in_memory_db.json"
 
     # create app and client
     app = create_app(enable_auth=True, flask_configfile=config_file_path)
@@ -12,39 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
-from pathlib import Path
+import pytest
 
 from asreview.project import PATH_FEATURE_MATRICES
-from asreview.utils import asreview_path
 from asreview.webapp.authentication.models import Project
 from asreview.webapp.authentication.models import User
+from asreview.webapp.tests.conftest import count_rows
+from asreview.webapp.tests.conftest import get_folder_content
+from asreview.webapp.tests.conftest import get_user_with_projects
 from asreview.webapp.tests.conftest import signin_user
 from asreview.webapp.tests.conftest import signout
 from asreview.webapp.tests.conftest import signup_user
+from asreview.webapp.tests.conftest import wait_for_status
+from asreview.webapp.tests.conftest import wait_for_training
+
+# the tests below share one project and run in order, keep them on one worker
+pytestmark = [
+    pytest.mark.xdist_group("project_api_auth"),
+    pytest.mark.usefixtures("no_project_leak"),
+]
 
 PASSWORD = "1234ABC!"
 USER_2 = "user2@authtest.nl"
 
 
-def test_get_projects(setup_teardown_signed_in):
-    """Test get projects."""
-    _, client, _ = setup_teardown_signed_in
-
-    response = client.get("/api/projects")
-    json_data = response.get_json()
-
-    assert "result" in json_data
-    assert isinstance(json_data["result"], list)
-
-
-def test_init_project(setup_teardown_signed_in):
+def test_init_project(setup_teardown_signed_in, project_uuid, asreview_test_folder):
     """Test create project."""
     _, client, user = setup_teardown_signed_in
 
     # verify we have 0 projects in the database and 1 user
-    assert len(User.query.all()) == 1
-    assert len(Project.query.all()) == 0
+    assert count_rows(User) == 1
+    assert count_rows(Project) == 0
 
     response = client.post(
         "/api/projects/info",
@@ -59,18 +57,17 @@ def test_init_project(setup_teardown_signed_in):
 
     # make sure a folder is created
     new_project_id = json_data["id"]
-    assert Path(asreview_path(), new_project_id).exists()
-    assert Path(asreview_path(), new_project_id, "data").exists()
-    assert Path(asreview_path(), new_project_id, "reviews").exists()
-    assert Path(asreview_path(), new_project_id, PATH_FEATURE_MATRICES).exists()
+    assert new_project_id == project_uuid("project-id", user.id)
+    project_path = asreview_test_folder / new_project_id
+    assert project_path.is_dir()
+    folder_content = get_folder_content(project_path)
+    assert {"data", "reviews", PATH_FEATURE_MATRICES} <= folder_content
 
     # make sure the project can be found in the database as well
-    assert len(Project.query.all()) == 1
-    # get project
-    project = Project.query.filter(Project.project_id == new_project_id).one()
+    project = Project.query.one()
     assert project.project_id == new_project_id
     assert project.folder == new_project_id
-    assert project.project_path == Path(asreview_path(), new_project_id)
+    assert project.project_path == project_path
     assert project.owner_id == user.id
 
     assert response.status_code == 201
@@ -87,12 +84,10 @@ def test_upgrade_project_if_old(setup_teardown_signed_in):
     assert response.status_code == 400
 
 
-def test_get_projects_stats(setup_teardown_signed_in):
+def test_get_projects_stats(signed_in_get):
     """Test get dashboard statistics of all projects"""
 
-    _, client, _ = setup_teardown_signed_in
-
-    response = client.get("/api/projects/stats")
+    response = signed_in_get("/api/projects/stats")
     json_data = response.get_json()
 
     assert "n_in_review" in json_data["result"]
@@ -100,21 +95,6 @@ def test_get_projects_stats(setup_teardown_signed_in):
     assert isinstance(json_data["result"], dict)
 
 
-def test_demo_data_project(setup_teardown_signed_in):
-    """Test retrieve plugin and benchmark datasets"""
-    _, client, _ = setup_teardown_signed_in
-
-    response_plugin = client.get("/api/datasets?subset=plugin")
-    response_benchmark = client.get("/api/datasets?subset=benchmark")
-    json_plugin_data = response_plugin.get_json()
-    json_benchmark_data = response_benchmark.get_json()
-
-    assert "result" in json_plugin_data
-    assert "result" in json_benchmark_data
-    assert isinstance(json_plugin_data["result"], list)
-    assert isinstance(json_benchmark_data["result"], list)
-
-
 def test_upload_data_to_project(setup_teardown_signed_in):
     """Test upload data to project."""
     _, client, _ = setup_teardown_signed_in
@@ -127,35 +107,20 @@ def test_upload_data_to_project(setup_teardown_signed_in):
     assert response.status_code == 200
 
 
-def test_get_project_data(setup_teardown_signed_in):
+def test_get_project_data(signed_in_get):
     """Test get info on the data"""
-    _, client, _ = setup_teardown_signed_in
-
     project = Project.query.one()
-    response = client.get(f"/api/projects/{project.project_id}/data")
+    response = signed_in_get(f"/api/projects/{project.project_id}/data")
     json_data = response.get_json()
     assert json_data["filename"] == "Hall_2012"
 
 
-def test_get_dataset_writer(setup_teardown_signed_in):
-    """Test get dataset writer"""
-    _, client, _ = setup_teardown_signed_in
-
-    project = Project.query.one()
-    response = client.get(f"/api/projects/{project.project_id}/dataset_writer")
-    json_data = response.get_json()
-    assert isinstance(json_data["result"], list)
-
-
-def test_update_project_info_no_name_change(setup_teardown_signed_in):
+def test_update_project_info_no_name_change(setup_teardown_signed_in, project_uuid):
     """Test update project info -without- changing the project name"""
     _, client, user = setup_teardown_signed_in
 
-    # assert if we still have one project in the database
-    assert len(Project.query.all()) == 1
-
-    project = Project.query.one()
-    old_project_id = project.project_id
+    old_project_id = Project.query.one().project_id
+    assert old_project_id == project_uuid("project-id", user.id)
     response = client.put(
         f"/api/projects/{old_project_id}/info",
         data={
@@ -167,13 +132,13 @@ def test_update_project_info_no_name_change(setup_teardown_signed_in):
     )
     assert response.status_code == 200
 
-    # assert if we still have one project in the database
-    assert len(Project.query.all()) == 1
-    project = Project.query.one()
-    assert project.project_id == old_project_id
+    # assert if the project id is unchanged
+    assert Project.query.one().project_id == old_project_id
 
 
-def test_update_project_info_with_name_change(setup_teardown_signed_in):
+def test_update_project_info_with_name_change(
+    setup_teardown_signed_in, project_uuid, asreview_test_folder
+):
     """Test update project info -with- changing the project name"""
     _, client, user = setup_teardown_signed_in
 
@@ -182,7 +147,7 @@ def test_update_project_info_with_name_change(setup_teardown_signed_in):
     old_project_id = project.project_id
 
     # verify project folder exists
-    assert Path(asreview_path(), old_project_id).exists() is True
+    assert (asreview_test_folder / old_project_id).exists() is True
 
     response = client.put(
         f"/api/projects/{old_project_id}/info",
@@ -197,30 +162,33 @@ def test_update_project_info_with_name_change(setup_teardown_signed_in):
 
     json_data = response.get_json()
     new_project_id = json_data["id"]
+    assert new_project_id == project_uuid("another-project", user.id)
 
     # check if folder has been renamed
-    assert Path(asreview_path(), new_project_id).exists()
-    assert Path(asreview_path(), new_project_id, "data").exists()
-    assert Path(asreview_path(), new_project_id, "reviews").exists()
-    assert Path(asreview_path(), new_project_id, PATH_FEATURE_MATRICES).exists()
+    new_project_path = asreview_test_folder / new_project_id
+    assert new_project_path.is_dir()
+    folder_content = get_folder_content(new_project_path)
+    assert {"data", "reviews", PATH_FEATURE_MATRICES} <= folder_content
 
     # check if old folder is removed
-    assert Path(asreview_path(), old_project_id).exists() is False
+    assert (asreview_test_folder / old_project_id).exists() is False
 
     # now we check the database
-    assert len(Project.query.all()) == 1
     project = Project.query.one()
     assert project.project_id == new_project_id
     assert project.owner_id == user.id
 
 
-def test_get_project_info(setup_teardown_signed_in):
-    """Test get info on the project, start with a new project"""
+@pytest.fixture(scope="module")
+def project_with_data(setup_teardown_signed_in):
+    """Create a project with the Hall_2012 benchmark dataset.
+
+    The first project was renamed by the tests above, so a new project
+    with the old name is added. Returns the client and the project id.
+    """
     _, client, _ = setup_teardown_signed_in
 
-    # since we have renamed the previous project we have to
-    # add the old project again
-    client.post(
+    response = client.post(
         "/api/projects/info",
         data={
             "mode": "explore",
@@ -229,82 +197,101 @@ def test_get_project_info(setup_teardown_signed_in):
             "description": "hello world",
         },
     )
+    assert response.status_code == 201
+    project_id = response.get_json()["id"]
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    client.post(
-        f"/api/projects/{project.project_id}/data",
+    response = client.post(
+        f"/api/projects/{project_id}/data",
         data={"benchmark": "benchmark:Hall_2012"},
     )
+    assert response.status_code == 200
 
-    # call the info method
-    response = client.get(f"/api/projects/{project.project_id}/info")
+    return client, project_id
+
+
+def test_get_project_info(project_with_data):
+    """Test get info on the project"""
+    client, project_id = project_with_data
+
+    response = client.get(f"/api/projects/{project_id}/info")
     json_data = response.get_json()
     assert json_data["authors"] == "asreview team"
     assert json_data["dataset_path"] == "Hall_2012.csv"
 
 
-def test_search_data(setup_teardown_signed_in):
-    """Test search for papers"""
-    _, client, _ = setup_teardown_signed_in
+def test_label_item(project_with_data):
+    """Test label item"""
+    client, project_id = project_with_data
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(
-        f"/api/projects/{project.project_id}/search?q=Software&n_max=10"
+    response = client.post(
+        f"/api/projects/{project_id}/records",
+        json=[
+            {"doc_id": 5509, "label": 0, "is_prior": 1},
+            {"doc_id": 58, "label": 1, "is_prior": 1},
+        ],
     )
-    json_data = response.get_json()
 
-    assert "result" in json_data
-    assert isinstance(json_data["result"], list)
+    assert response.status_code == 200
 
 
-def test_random_prior_papers(setup_teardown_signed_in):
-    """Test get a selection of random papers to find exclusions"""
-    _, client, _ = setup_teardown_signed_in
+@pytest.mark.parametrize(
+    "records",
+    [
+        {"doc_id": 1, "label": 1, "is_prior": 1},
+        [],
+        [{"label": 1, "is_prior": 1}],
+        [{"doc_id": 1, "label": 1, "is_prior": 1}, {"doc_id": 2, "label": 0}],
+    ],
+    ids=["no-list", "empty", "no-doc-id", "prior-and-not-prior"],
+)
+def test_label_items_bad_request(project_with_data, records):
+    """Test label items with an invalid list of records"""
+    client, project_id = project_with_data
+
+    response = client.post(f"/api/projects/{project_id}/records", json=records)
+    assert response.status_code == 400
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/prior_random")
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/projects",
+        "/api/datasets?subset=plugin",
+        "/api/datasets?subset=benchmark",
+    ],
+)
+def test_get_list_endpoint(signed_in_get, url):
+    """Test the GET endpoints that return a list of results"""
+    response = signed_in_get(url)
     json_data = response.get_json()
 
-    assert "result" in json_data
+    assert response.status_code == 200
     assert isinstance(json_data["result"], list)
 
 
-def test_label_item(setup_teardown_signed_in):
-    """Test label item"""
-    _, client, _ = setup_teardown_signed_in
-
-    project = Project.query.order_by(Project.id.desc()).first()
-    response_irrelevant = client.post(
-        f"/api/projects/{project.project_id}/record/5509",
-        data={"doc_id": 5509, "label": 0, "is_prior": 1},
-    )
-    response_relevant = client.post(
-        f"/api/projects/{project.project_id}/record/58",
-        data={"doc_id": 58, "label": 1, "is_prior": 1},
-    )
-
-    assert response_irrelevant.status_code == 200
-    assert response_relevant.status_code == 200
-
-
-def test_get_labeled(setup_teardown_signed_in):
-    """Test get all papers classified as labeled documents"""
-    _, client, _ = setup_teardown_signed_in
-
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/labeled")
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "dataset_writer",
+        "search?q=Software&n_max=10",
+        "prior_random",
+        "labeled",
+    ],
+)
+def test_get_project_list_endpoint(signed_in_get, project_with_data, endpoint):
+    """Test the GET endpoints of a project that return a list of results"""
+    _, project_id = project_with_data
+    response = signed_in_get(f"/api/projects/{project_id}/{endpoint}")
     json_data = response.get_json()
 
-    assert "result" in json_data
+    assert response.status_code == 200
     assert isinstance(json_data["result"], list)
 
 
-def test_get_labeled_stats(setup_teardown_signed_in):
+def test_get_labeled_stats(signed_in_get, project_with_data):
     """Test get all papers classified as prior documents"""
-    _, client, _ = setup_teardown_signed_in
-
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/labeled_stats")
+    _, project_id = project_with_data
+    response = signed_in_get(f"/api/projects/{project_id}/labeled_stats")
     json_data = response.get_json()
 
     assert isinstance(json_data, dict)
@@ -312,11 +299,9 @@ def test_get_labeled_stats(setup_teardown_signed_in):
     assert json_data["n_prior"] == 2
 
 
-def test_list_algorithms(setup_teardown_signed_in):
+def test_list_algorithms(signed_in_get):
     """Test get list of active learning models"""
-    _, client, _ = setup_teardown_signed_in
-
-    response = client.get("/api/algorithms")
+    response = signed_in_get("/api/algorithms")
     json_data = response.get_json()
 
     assert "classifier" in json_data.keys()
@@ -324,13 +309,12 @@ def test_list_algorithms(setup_teardown_signed_in):
     assert isinstance(json_data, dict)
 
 
-def test_set_algorithms(setup_teardown_signed_in):
+def test_set_algorithms(project_with_data):
     """Test set active learning model"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = project_with_data
 
-    project = Project.query.order_by(Project.id.desc()).first()
     response = client.post(
-        f"/api/projects/{project.project_id}/algorithms",
+        f"/api/projects/{project_id}/algorithms",
         data={
             "model": "svm",
             "query_strategy": "max_random",
@@ -341,12 +325,10 @@ def test_set_algorithms(setup_teardown_signed_in):
     assert response.status_code == 200
 
 
-def test_get_algorithms(setup_teardown_signed_in):
+def test_get_algorithms(signed_in_get, project_with_data):
     """Test active learning model selection"""
-    _, client, _ = setup_teardown_signed_in
-
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/algorithms")
+    _, project_id = project_with_data
+    response = signed_in_get(f"/api/projects/{project_id}/algorithms")
     json_data = response.get_json()
 
     assert "model" in json_data
@@ -356,111 +338,131 @@ def test_get_algorithms(setup_teardown_signed_in):
     assert isinstance(json_data, dict)
 
 
-def test_start_and_model_ready(setup_teardown_signed_in):
-    """Test start training the model"""
-    _, client, _ = setup_teardown_signed_in
+@pytest.fixture(scope="module")
+def trained_project(project_with_data):
+    """Start training the project with data and wait for the first model.
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.post(f"/api/projects/{project.project_id}/start")
+    The model is trained once per module and shared by all tests that
+    need it. Returns the client and the project id.
+    """
+    client, project_id = project_with_data
+
+    response = client.post(f"/api/projects/{project_id}/start")
     assert response.status_code == 200
 
-    # wait the model ready
-    time.sleep(10)
+    # wait until the model is ready
+    wait_for_status(client, project_id, "review")
 
-    response = client.get(f"/api/projects/{project.project_id}/status")
+    return client, project_id
+
+
+def test_start_and_model_ready(trained_project):
+    """Test start training the model"""
+    client, project_id = trained_project
+
+    response = client.get(f"/api/projects/{project_id}/status")
     json_data = response.get_json()
     assert json_data["status"] == "review"
 
 
-def test_export_result(setup_teardown_signed_in):
+def test_export_result(trained_project):
     """Test export result"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = trained_project
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response_csv = client.get(
-        f"/api/projects/{project.project_id}/export_dataset?file_format=csv"
-    )
-    response_tsv = client.get(
-        f"/api/projects/{project.project_id}/export_dataset?file_format=tsv"
-    )
-    response_excel = client.get(
-        f"/api/projects/{project.project_id}/export_dataset?file_format=xlsx"
-    )
-    assert response_csv.status_code == 200
-    assert response_tsv.status_code == 200
-    assert response_excel.status_code == 200
+    # only check the status, don't read the exported files
+    for file_format in ["csv", "tsv", "xlsx"]:
+        with client.get(
+            f"/api/projects/{project_id}/export_dataset?file_format={file_format}",
+            buffered=False,
+        ) as response:
+            assert response.status_code == 200
 
 
-def test_export_project(setup_teardown_signed_in):
+def test_export_project(trained_project):
     """Test export the project file"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = trained_project
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/export_project")
-    assert response.status_code == 200
+    with client.get(
+        f"/api/projects/{project_id}/export_project", buffered=False
+    ) as response:
+        assert response.status_code == 200
 
 
-def test_finish_project(setup_teardown_signed_in):
+# the last case leaves the project finished for the tests below
+@pytest.mark.parametrize(
+    "from_status,to_status", [("finished", "review"), ("review", "finished")]
+)
+def test_finish_project(trained_project, from_status, to_status):
     """Test mark a project as finished or not"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = trained_project
+    url = f"/api/projects/{project_id}/status"
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.put(
-        f"/api/projects/{project.project_id}/status", data={"status": "finished"}
-    )
-    assert response.status_code == 200
-
-    response = client.put(
-        f"/api/projects/{project.project_id}/status", data={"status": "review"}
-    )
-    assert response.status_code == 200
+    # put the project in the status the transition starts from
+    if client.get(url).get_json()["status"] != from_status:
+        response = client.put(url, data={"status": from_status})
+        assert response.status_code == 200
 
-    response = client.put(
-        f"/api/projects/{project.project_id}/status", data={"status": "finished"}
-    )
+    response = client.put(url, data={"status": to_status})
     assert response.status_code == 200
 
 
-def test_get_progress_info(setup_teardown_signed_in):
+def test_get_progress_info(trained_project):
     """Test get progress info on the article"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = trained_project
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/progress")
+    response = client.get(f"/api/projects/{project_id}/progress")
     json_data = response.get_json()
     assert isinstance(json_data, dict)
 
 
-def test_get_progress_density(setup_teardown_signed_in):
+def test_get_progress_density(trained_project):
     """Test get progress density on the article"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = trained_project
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/progress_density")
+    response = client.get(f"/api/projects/{project_id}/progress_density")
     json_data = response.get_json()
     assert "relevant" in json_data
     assert "irrelevant" in json_data
     assert isinstance(json_data, dict)
 
 
-def test_get_progress_recall(setup_teardown_signed_in):
+def test_get_progress_recall(trained_project):
     """Test get cumulative number of inclusions by ASReview/at random"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = trained_project
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/progress_recall")
+    response = client.get(f"/api/projects/{project_id}/progress_recall")
     json_data = response.get_json()
     assert "asreview" in json_data
     assert "random" in json_data
     assert isinstance(json_data, dict)
 
 
-def test_get_document(setup_teardown_signed_in):
+def test_label_pending_items(trained_project, asreview_test_folder):
+    """Test label the pending record, which retrains the model"""
+    client, project_id = trained_project
+
+    response = client.get(f"/api/projects/{project_id}/get_document")
+    doc_id = response.get_json()["result"]["doc_id"]
+
+    response = client.post(
+        f"/api/projects/{project_id}/records",
+        json=[{"doc_id": doc_id, "label": 1, "note": "relevant"}],
+    )
+    assert response.status_code == 200
+
+    # the labeled record is no longer pending
+    response = client.get(f"/api/projects/{project_id}/get_document")
+    assert response.get_json()["result"]["doc_id"] != doc_id
+
+    # don't leave the retraining running for the tests below
+    wait_for_training(asreview_test_folder / project_id)
+
+
+def test_get_document(trained_project, asreview_test_folder):
     """Test retrieve documents in order of review"""
-    _, client, _ = setup_teardown_signed_in
+    client, project_id = trained_project
 
-    project = Project.query.order_by(Project.id.desc()).first()
-    response = client.get(f"/api/projects/{project.project_id}/get_document")
+    response = client.get(f"/api/projects/{project_id}/get_document")
     json_data = response.get_json()
 
     assert "result" in json_data
@@ -470,7 +472,7 @@ def test_get_document(setup_teardown_signed_in):
 
     # Test retrieve classification result
     response = client.post(
-        f"/api/projects/{project.project_id}/record/{doc_id}",
+        f"/api/projects/{project_id}/record/{doc_id}",
         data={
             "doc_id": doc_id,
             "label": 1,
@@ -480,7 +482,7 @@ def test_get_document(setup_teardown_signed_in):
 
     # Test update classification result
     response = client.put(
-        f"/api/projects/{project.project_id}/record/{doc_id}",
+        f"/api/projects/{project_id}/record/{doc_id}",
         data={
             "doc_id": doc_id,
             "label": 0,
@@ -488,14 +490,16 @@ def test_get_document(setup_teardown_signed_in):
     )
     assert response.status_code == 200
 
-    time.sleep(10)
+    # don't leave the retraining running for the tests below
+    wait_for_training(asreview_test_folder / project_id)
 
 
-def test_delete_project(setup_teardown_signed_in):
+def test_delete_project(setup_teardown_signed_in, project_uuid, asreview_test_folder):
     """Test get info on the article"""
     _, client, user = setup_teardown_signed_in
 
     # assert we have two projects in the table
+    user = get_user_with_projects(user.id)
     assert len(user.projects) == 2
     # api call
     project = Project.query.order_by(Project.id.desc()).first()
@@ -503,14 +507,16 @@ def test_delete_project(setup_teardown_signed_in):
     assert response.status_code == 200
 
     # assert folder is gone
-    assert Path(asreview_path(), project.project_id).exists() is False
+    assert (asreview_test_folder / project.project_id).exists() is False
 
     # assert that one project is gone
+    user = get_user_with_projects(user.id)
     assert len(user.projects) == 1
 
     # assert if the other project still exists
     project = Project.query.one()
-    assert Path(asreview_path(), project.project_id).exists()
+    assert project.project_id == project_uuid("another-project", user.id)
+    assert (asreview_test_folder / project.project_id).exists()
     # make sure it has the correct name
     response = client.get(f"/api/projects/{project.project_id}/info")
     json_data = response.get_json()
@@ -526,13 +532,13 @@ def test_adding_a_second_user_and_projects(setup_teardown_signed_in):
     """Adding a second user and a project of that user"""
     _, client, user = setup_teardown_signed_in
     # get number of projects in database
-    old_projects = Project.query.all()
+    n_old_projects = count_rows(Project)
     # signout current user
     signout(client)
     # create new user
     signup_user(client, USER_2, PASSWORD)
     # assert if we have 2 users now
-    assert len(User.query.all()) == 2
+    assert count_rows(User) == 2
     # signin user 2
     signin_user(client, USER_2, PASSWORD)
     # create project
@@ -546,7 +552,7 @@ def test_adding_a_second_user_and_projects(setup_teardown_signed_in):
         },
     )
     # assert we have this project
-    assert len(Project.query.all()) == len(old_projects) + 1
+    assert count_rows(Project) == n_old_projects + 1
     user = User.query.filter(User.identifier == USER_2).first()
     assert len(user.projects) == 1
 
@@ -824,6 +830,20 @@ def test_classify_instance_no_permission(setup_teardown_signed_in):
     assert json_data["message"] == "no permission"
 
 
+def test_classify_instances_no_permission(setup_teardown_signed_in):
+    """Test label multiple items"""
+    _, client, _ = setup_teardown_signed_in
+
+    project = Project.query.order_by(Project.id.desc()).first()
+    response = client.post(
+        f"/api/projects/{project.project_id}/records",
+        json=[{"doc_id": 4567, "label": 1, "is_prior": 1}],
+    )
+    json_data = response.get_json()
+    assert response.status_code == 403
+    assert json_data["message"] == "no permission"
+
+
 def test_get_document_no_permission(setup_teardown_signed_in):
     """Test retrieve documents in order of review"""
     _, client, _ = setup_teardown_signed_in
@@ -18,6 +18,10 @@ from pathlib import Path
 from asreview.project import PATH_FEATURE_MATRICES
 from asreview.project import _create_project_id
 from asreview.utils import asreview_path
+from asreview.webapp.tests.conftest import wait_for_status
+
+PROJECT_ID = "project-id"
+PROJECT_URL = f"/api/projects/{PROJECT_ID}"
 
 
 def test_get_projects(setup_teardown_unauthorized):
@@ -63,7 +67,7 @@ def test_upgrade_project_if_old(setup_teardown_unauthorized):
     """Test upgrade project if it is v0.x"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/upgrade_if_old")
+    response = client.get(f"{PROJECT_URL}/upgrade_if_old")
     assert response.status_code == 400
 
 
@@ -99,7 +103,7 @@ def test_upload_data_to_project(setup_teardown_unauthorized):
     _, client = setup_teardown_unauthorized
 
     response = client.post(
-        "/api/projects/project-id/data", data={"benchmark": "benchmark:Hall_2012"}
+        f"{PROJECT_URL}/data", data={"benchmark": "benchmark:Hall_2012"}
     )
     assert response.status_code == 200
 
@@ -108,7 +112,7 @@ def test_get_project_data(setup_teardown_unauthorized):
     """Test get info on the data"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/data")
+    response = client.get(f"{PROJECT_URL}/data")
     json_data = response.get_json()
     assert json_data["filename"] == "Hall_2012"
 
@@ -117,7 +121,7 @@ def test_get_dataset_writer(setup_teardown_unauthorized):
     """Test get dataset writer"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/dataset_writer")
+    response = client.get(f"{PROJECT_URL}/dataset_writer")
     json_data = response.get_json()
     assert isinstance(json_data["result"], list)
 
@@ -127,7 +131,7 @@ def test_update_project_info_no_name_change(setup_teardown_unauthorized):
     _, client = setup_teardown_unauthorized
 
     response = client.put(
-        "/api/projects/project-id/info",
+        f"{PROJECT_URL}/info",
         data={
             "mode": "explore",
             "name": "project_id",
@@ -143,7 +147,7 @@ def test_update_project_info_with_name_change(setup_teardown_unauthorized):
     _, client = setup_teardown_unauthorized
 
     new_project_name = "another_project"
-    old_project_id = "project-id"
+    old_project_id = PROJECT_ID
 
     response = client.put(
         f"/api/projects/{old_project_id}/info",
@@ -182,12 +186,10 @@ def test_get_project_info(setup_teardown_unauthorized):
             "description": "hello world",
         },
     )
-    client.post(
-        "/api/projects/project-id/data", data={"benchmark": "benchmark:Hall_2012"}
-    )
+    client.post(f"{PROJECT_URL}/data", data={"benchmark": "benchmark:Hall_2012"})
 
     # call the info method
-    response = client.get("/api/projects/project-id/info")
+    response = client.get(f"{PROJECT_URL}/info")
     json_data = response.get_json()
     assert json_data["authors"] == "asreview team"
     assert json_data["dataset_path"] == "Hall_2012.csv"
@@ -197,7 +199,7 @@ def test_search_data(setup_teardown_unauthorized):
     """Test search for papers"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/search?q=Software&n_max=10")
+    response = client.get(f"{PROJECT_URL}/search?q=Software&n_max=10")
     json_data = response.get_json()
 
     assert "result" in json_data
@@ -208,7 +210,7 @@ def test_random_prior_papers(setup_teardown_unauthorized):
     """Test get a selection of random papers to find exclusions"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/prior_random")
+    response = client.get(f"{PROJECT_URL}/prior_random")
     json_data = response.get_json()
 
     assert "result" in json_data
@@ -219,24 +221,22 @@ def test_label_item(setup_teardown_unauthorized):
     """Test label item"""
     _, client = setup_teardown_unauthorized
 
-    response_irrelevant = client.post(
-        "/api/projects/project-id/record/5509",
-        data={"doc_id": 5509, "label": 0, "is_prior": 1},
-    )
-    response_relevant = client.post(
-        "/api/projects/project-id/record/58",
-        data={"doc_id": 58, "label": 1, "is_prior": 1},
+    response = client.post(
+        f"{PROJECT_URL}/records",
+        json=[
+            {"doc_id": 5509, "label": 0, "is_prior": 1},
+            {"doc_id": 58, "label": 1, "is_prior": 1},
+        ],
     )
 
-    assert response_irrelevant.status_code == 200
-    assert response_relevant.status_code == 200
+    assert response.status_code == 200
 
 
 def test_get_labeled(setup_teardown_unauthorized):
     """Test get all papers classified as labeled documents"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/labeled")
+    response = client.get(f"{PROJECT_URL}/labeled")
     json_data = response.get_json()
 
     assert "result" in json_data
@@ -247,7 +247,7 @@ def test_get_labeled_stats(setup_teardown_unauthorized):
     """Test get all papers classified as prior documents"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/labeled_stats")
+    response = client.get(f"{PROJECT_URL}/labeled_stats")
     json_data = response.get_json()
 
     assert isinstance(json_data, dict)
@@ -272,7 +272,7 @@ def test_set_algorithms(setup_teardown_unauthorized):
     _, client = setup_teardown_unauthorized
 
     response = client.post(
-        "/api/projects/project-id/algorithms",
+        f"{PROJECT_URL}/algorithms",
         data={
             "model": "svm",
             "query_strategy": "max_random",
@@ -287,7 +287,7 @@ def test_get_algorithms(setup_teardown_unauthorized):
     """Test active learning model selection"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/algorithms")
+    response = client.get(f"{PROJECT_URL}/algorithms")
     json_data = response.get_json()
 
     assert "model" in json_data
@@ -301,13 +301,11 @@ def test_start_and_model_ready(setup_teardown_unauthorized):
     """Test start training the model"""
     _, client = setup_teardown_unauthorized
 
-    response = client.post("/api/projects/project-id/start")
+    response = client.post(f"{PROJECT_URL}/start")
     assert response.status_code == 200
 
     # wait until the model is ready
-    time.sleep(10)
-
-    response = client.get("/api/projects/project-id/status")
+    response = wait_for_status(client, PROJECT_ID, "review")
     json_data = response.get_json()
     assert json_data["status"] == "review"
 
@@ -316,11 +314,9 @@ def test_export_result(setup_teardown_unauthorized):
     """Test export result"""
     _, client = setup_teardown_unauthorized
 
-    response_csv = client.get("/api/projects/project-id/export_dataset?file_format=csv")
-    response_tsv = client.get("/api/projects/project-id/export_dataset?file_format=tsv")
-    response_excel = client.get(
-        "/api/projects/project-id/export_dataset?file_format=xlsx"
-    )
+    response_csv = client.get(f"{PROJECT_URL}/export_dataset?file_format=csv")
+    response_tsv = client.get(f"{PROJECT_URL}/export_dataset?file_format=tsv")
+    response_excel = client.get(f"{PROJECT_URL}/export_dataset?file_format=xlsx")
     assert response_csv.status_code == 200
     assert response_tsv.status_code == 200
     assert response_excel.status_code == 200
@@ -330,7 +326,7 @@ def test_export_project(setup_teardown_unauthorized):
     """Test export the project file"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/export_project")
+    response = client.get(f"{PROJECT_URL}/export_project")
     assert response.status_code == 200
 
 
@@ -338,17 +334,13 @@ def test_finish_project(setup_teardown_unauthorized):
     """Test mark a project as finished or not"""
     _, client = setup_teardown_unauthorized
 
-    response = client.put(
-        "/api/projects/project-id/status", data={"status": "finished"}
-    )
+    response = client.put(f"{PROJECT_URL}/status", data={"status": "finished"})
     assert response.status_code == 200
 
-    response = client.put("/api/projects/project-id/status", data={"status": "review"})
+    response = client.put(f"{PROJECT_URL}/status", data={"status": "review"})
     assert response.status_code == 200
 
-    response = client.put(
-        "/api/projects/project-id/status", data={"status": "finished"}
-    )
+    response = client.put(f"{PROJECT_URL}/status", data={"status": "finished"})
     assert response.status_code == 200
 
 
@@ -356,7 +348,7 @@ def test_get_progress_info(setup_teardown_unauthorized):
     """Test get progress info on the article"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/progress")
+    response = client.get(f"{PROJECT_URL}/progress")
     json_data = response.get_json()
     assert isinstance(json_data, dict)
 
@@ -365,7 +357,7 @@ def test_get_progress_density(setup_teardown_unauthorized):
     """Test get progress density on the article"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/progress_density")
+    response = client.get(f"{PROJECT_URL}/progress_density")
     json_data = response.get_json()
     assert "relevant" in json_data
     assert "irrelevant" in json_data
@@ -376,7 +368,7 @@ def test_get_progress_recall(setup_teardown_unauthorized):
     """Test get cumulative number of inclusions by ASReview/at random"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/progress_recall")
+    response = client.get(f"{PROJECT_URL}/progress_recall")
     json_data = response.get_json()
     assert "asreview" in json_data
     assert "random" in json_data
@@ -387,7 +379,7 @@ def test_get_document(setup_teardown_unauthorized):
     """Test retrieve documents in order of review"""
     _, client = setup_teardown_unauthorized
 
-    response = client.get("/api/projects/project-id/get_document")
+    response = client.get(f"{PROJECT_URL}/get_document")
     json_data = response.get_json()
 
     assert "result" in json_data
@@ -397,7 +389,7 @@ def test_get_document(setup_teardown_unauthorized):
 
     # Test retrieve classification result
     response = client.post(
-        f"/api/projects/project-id/record/{doc_id}",
+        f"{PROJECT_URL}/record/{doc_id}",
         data={
             "doc_id": doc_id,
             "label": 1,
@@ -407,7 +399,7 @@ def test_get_document(setup_teardown_unauthorized):
 
     # Test update classification result
     response = client.put(
-        f"/api/projects/project-id/record/{doc_id}",
+        f"{PROJECT_URL}/record/{doc_id}",
         data={
             "doc_id": doc_id,
             "label": 0,
@@ -421,5 +413,5 @@ def test_delete_project(setup_teardown_unauthorized):
     """Test get info on the article"""
     _, client = setup_teardown_unauthorized
 
-    response = client.delete("/api/projects/project-id/delete")
+    response = client.delete(f"{PROJECT_URL}/delete")
     assert response.status_code == 200